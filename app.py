@@ -1,3 +1,4 @@
+import os
 import streamlit as st
 import pandas as pd
 from src.controller.flight_delay_controller import FlightDelayController
@@ -6,8 +7,9 @@ from src.controller.flight_delay_controller import FlightDelayController
 def main():
     st.set_page_config(page_title="Flight Delay Prediction App", layout="wide")
     
-    # Initialize the controller
-    controller = FlightDelayController()
+    # Initialize the controller, serving the compact model when model_compaction.py has produced one
+    model_file = "models/compact_model.pkl" if os.path.exists("models/compact_model.pkl") else "models/best_model.pkl"
+    controller = FlightDelayController(model_file)
 
     # Create the Streamlit app
     st.sidebar.title("Flight Delay Prediction and Data & Model Monitoring App")
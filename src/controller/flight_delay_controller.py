@@ -15,8 +15,8 @@ class FlightDelayController:
     """
     
     
-    def __init__(self):
-        self.model = FlightDelayModel()
+    def __init__(self, model_file="models/best_model.pkl"):
+        self.model = FlightDelayModel(model_file)
         self.view = FlightDelayView()
         self.selected_data=self.model.selected_data()
         self.categorical_options=self.model.categorical_features()
@@ -86,7 +86,9 @@ class FlightDelayController:
         # Create select boxes for categorical features
         for feature,options in self.categorical_options.items():
             selected_value=st.sidebar.selectbox(f"Select {feature}:",options)
-            self.selected_data[feature+"_"+selected_value] = 1
+            # One-hot columns dropped from a compact model are not encoded
+            if feature+"_"+selected_value in self.selected_data:
+                self.selected_data[feature+"_"+selected_value] = 1
 
     
     def run_monitoring(self):
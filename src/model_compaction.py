@@ -0,0 +1,167 @@
+# model_compaction.py
+import io
+import time
+import tracemalloc
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+import xgboost as xgb
+import lightgbm as lgb
+import joblib
+
+
+numerical_features = [
+    'Month', 'DayofMonth', 'DayOfWeek', 'DepTime', 'CRSDepTime', 'CRSArrTime', 'FlightNum',
+    'CRSElapsedTime', 'AirTime', 'DepDelay', 'Distance', 'TaxiIn', 'TaxiOut',
+    'CarrierDelay', 'WeatherDelay', 'NASDelay', 'SecurityDelay', 'LateAircraftDelay'
+]
+
+# Factory Method for the tree models that can be compacted
+def create_model(model_name):
+    if model_name == "xgboost":
+        return xgb.XGBRegressor()
+    elif model_name == "lightgbm":
+        return lgb.LGBMRegressor()
+
+
+def used_features(model_name, model, columns):
+    """
+    Returns the features the saved tree model actually splits on.
+
+    Args:
+        model_name (str): Either "xgboost" or "lightgbm".
+        model: The trained model loaded from disk.
+        columns (list): The columns of the cleaned dataset.
+
+    Returns:
+        set: Names of the features with at least one split.
+    """
+    if model_name == "xgboost":
+        # "weight" is the number of times a feature is used to split
+        features = set(model.get_booster().get_score(importance_type="weight"))
+    else:
+        booster = model.booster_
+        split_counts = booster.feature_importance(importance_type="split")
+        features = {name for name, count in zip(booster.feature_name(), split_counts) if count > 0}
+
+    # A model trained without column names reports f0..fN (xgboost) or Column_0..N
+    # (lightgbm), which would silently drop every one-hot column
+    unknown_features = features - set(columns)
+    if unknown_features:
+        raise ValueError(f"The {model_name} model reports features that are not in the dataset, "
+                         f"e.g. {sorted(unknown_features)[:5]}. Retrain it on the cleaned DataFrame.")
+    return features
+
+
+def model_size(model):
+    """
+    Returns the size of the pickled model in KiB.
+    """
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    return buffer.getbuffer().nbytes / 1024
+
+
+def evaluate_model(model, X_test, y_test):
+    y_pred = model.predict(X_test)
+    mae = mean_absolute_error(y_test, y_pred)
+    mse = mean_squared_error(y_test, y_pred)
+    r2 = r2_score(y_test, y_pred)
+    return mae, mse, r2
+
+
+def measure_prediction(model, features, n_runs=200):
+    """
+    Measures a single-row prediction the way the app makes it: one-hot
+    input dict -> DataFrame -> model.predict.
+
+    Args:
+        model: The trained model.
+        features (list): The columns the model was trained on.
+        n_runs (int): Number of predictions to time.
+
+    Returns:
+        tuple: Median latency in milliseconds and peak Python memory in KiB.
+            tracemalloc only sees Python allocations, so the memory figure is
+            the cost of building the input DataFrame, not the native predict
+            buffers of xgboost/lightgbm.
+    """
+    selected_data = {col: 0 for col in features}
+    timings = []
+    for _ in range(n_runs):
+        start_time = time.perf_counter()
+        model.predict(pd.DataFrame([selected_data])[features])
+        timings.append((time.perf_counter() - start_time) * 1000)
+    timings.sort()
+
+    tracemalloc.start()
+    model.predict(pd.DataFrame([selected_data])[features])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return timings[len(timings) // 2], peak / 1024
+
+
+# Load the cleaned dataset
+print("Data loading started...")
+cleaned_data = pd.read_csv("../data/cleaned_flight_delays.csv")
+print("Data loading completed")
+
+# Define the target variable (ArrDelay) and features (X)
+target_variable = "ArrDelay"
+X = cleaned_data.drop(columns=[target_variable])
+y = cleaned_data[target_variable]
+
+# Split the data into training and testing sets
+X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+# Collect the columns the saved tree models split on. The numerical features
+# are always kept because the app collects all of them; only one-hot columns
+# nobody splits on are dropped.
+full_models = {}
+kept_features = set(numerical_features)
+for model_name in ["xgboost", "lightgbm"]:
+    full_models[model_name] = joblib.load(f"../models/{model_name}_model.pkl")
+    kept_features |= used_features(model_name, full_models[model_name], X.columns)
+
+# Keep the original column order so the compact frame lines up with the full one
+compact_features = [col for col in X.columns if col in kept_features]
+print(f"Keeping {len(compact_features)} of {len(X.columns)} features")
+
+# Retrain each tree model on the reduced feature set and compare it with the full model
+metrics = {}
+compact_models = {}
+for model_name, full_model in full_models.items():
+    print(f"Training the compact {model_name} model...")
+    compact_model = create_model(model_name)
+    compact_model.fit(X_train[compact_features], y_train)
+    compact_models[model_name] = compact_model
+
+    for variant, model, features in [
+        ("full", full_model, list(X.columns)),
+        ("compact", compact_model, compact_features),
+    ]:
+        mae, mse, r2 = evaluate_model(model, X_test[features], y_test)
+        latency, memory = measure_prediction(model, features)
+        metrics[(model_name, variant)] = {
+            "MAE": mae, "MSE": mse, "R2": r2,
+            "Size": model_size(model), "Latency": latency, "Memory": memory,
+        }
+
+# Print the full vs compact comparison for each model
+for model_name in full_models:
+    full = metrics[(model_name, "full")]
+    compact = metrics[(model_name, "compact")]
+    print(f"Full vs compact {model_name}:")
+    print(f"Features: {len(X.columns)} -> {len(compact_features)}")
+    print(f"Mean Absolute Error (MAE): {full['MAE']:.2f} -> {compact['MAE']:.2f} (delta {compact['MAE'] - full['MAE']:+.4f})")
+    print(f"Mean Squared Error (MSE): {full['MSE']:.2f} -> {compact['MSE']:.2f} (delta {compact['MSE'] - full['MSE']:+.4f})")
+    print(f"R-squared (R2) Score: {full['R2']:.4f} -> {compact['R2']:.4f} (delta {compact['R2'] - full['R2']:+.4f})")
+    print(f"Model size: {full['Size']:.1f} KiB -> {compact['Size']:.1f} KiB")
+    print(f"Predict latency (median, 1 row): {full['Latency']:.2f} ms -> {compact['Latency']:.2f} ms")
+    print(f"Input-building peak Python memory (1 row, excludes native predict buffers): {full['Memory']:.1f} KiB -> {compact['Memory']:.1f} KiB")
+    print()
+
+# Save the best compact model together with the feature list it expects in one file
+best_model = max(compact_models, key=lambda model_name: metrics[(model_name, "compact")]["R2"])
+joblib.dump({"model": compact_models[best_model], "features": compact_features}, "../models/compact_model.pkl")
+print(f"Best compact model ({best_model}) saved with its features as compact_model.pkl")